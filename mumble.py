@@ -11,9 +11,13 @@ Logs to mumble.log (in ~/.mumble/ when installed, or same directory in dev mode)
 """
 
 import argparse
+import ctypes
+import io
+import json
 import logging
 import logging.handlers
 import os
+import queue
 import re
 import shutil
 import subprocess
@@ -21,17 +25,28 @@ import sys
 import threading
 import time
 import tomllib
+import wave
 import winsound
-from math import gcd
+from ctypes import wintypes
+from dataclasses import dataclass, field
 
+# Must be set before ctranslate2 loads: lets CT2 capture the batch=1 decode
+# loop as a CUDA graph, replayed on every utterance instead of relaunching kernels.
+os.environ.setdefault("CT2_CUDA_USE_GRAPH", "1")
+
+# Physical-core estimate — oversubscribing SMT siblings hurts int8 GEMM
+# throughput. Pinned via env before ctranslate2/OpenMP initialize.
+_CPU_THREADS = max(1, (os.cpu_count() or 2) // 2)
+os.environ.setdefault("OMP_NUM_THREADS", str(_CPU_THREADS))
+
+import ctranslate2
 import keyboard
 import numpy as np
 import pyperclip
 import sounddevice as sd
+import soxr
 from faster_whisper import WhisperModel
 from PIL import Image, ImageDraw
-from scipy.signal import resample_poly
-from pynput.keyboard import Controller as KBController, Key
 
 import pystray
 
@@ -77,6 +92,8 @@ _DEFAULTS = {
     "whisper": {
         "model": "small.en",
         "sample_rate": 16000,
+        "beam_size": 1,
+        "vad_filter": True,
     },
     "audio": {
         "device_name": "C200",
@@ -108,6 +125,8 @@ QUIT_HOTKEY = _get("hotkeys", "quit")
 REPASTE_HOTKEY = _get("hotkeys", "repaste")
 MODEL = _get("whisper", "model")
 WHISPER_RATE = _get("whisper", "sample_rate")
+BEAM_SIZE = _get("whisper", "beam_size")
+VAD_FILTER = _get("whisper", "vad_filter")
 DEVICE_NAME_SUBSTRING = _get("audio", "device_name")
 MAX_DURATION = _get("audio", "max_duration")
 
@@ -120,20 +139,60 @@ handler = logging.handlers.RotatingFileHandler(
     LOG_FILE, maxBytes=1_000_000, backupCount=1,
 )
 handler.setFormatter(logging.Formatter("%(asctime)s  %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
-log.addHandler(handler)
+# Log calls only enqueue; the listener thread does the actual file writes.
+# Keeps logging O(1) on hot paths — audio_callback runs on PortAudio's
+# real-time thread and must never block on disk.
+_log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, handler)
+_log_listener.start()
 
 # --- Globals ---
-recording = False
-audio_chunks = []
+STREAM_CHUNK_S = 5  # chunk length for streaming transcription
+BLOCKSIZE = 1024  # mic stream block size, in frames
 last_transcription = None
-kb = KBController()
 model = None
 device_index = None
 record_rate = 48000
-input_stream = None
 tray_icon = None
 shutdown_event = threading.Event()
-recording_timer = None
+
+
+# --- Feedback tones ---
+
+def _tone_wav(tones, rate=22050):
+    """Synthesize a sequence of (freq_hz, duration_ms) sine tones as WAV bytes."""
+    parts = []
+    for freq, ms in tones:
+        t = np.arange(int(rate * ms / 1000))
+        tone = 0.4 * np.sin(2 * np.pi * freq * t / rate)
+        # Short fade in/out to avoid clicks
+        fade = min(len(tone) // 8, 256)
+        tone[:fade] *= np.linspace(0.0, 1.0, fade)
+        tone[-fade:] *= np.linspace(1.0, 0.0, fade)
+        parts.append(tone)
+    pcm = (np.concatenate(parts) * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+# Synthesized once at import. winsound.Beep blocks its caller for the full
+# tone duration (on the hotkey thread that delayed recording start by 150ms);
+# PlaySound with SND_ASYNC returns immediately.
+_WAV_START = _tone_wav([(1000, 150)])
+_WAV_STOP = _tone_wav([(500, 150)])
+_WAV_ERROR = _tone_wav([(300, 200)])
+_WAV_READY = _tone_wav([(800, 100), (1000, 100)])
+
+
+def play_tone(wav):
+    """Play a pre-synthesized tone without blocking the caller."""
+    winsound.PlaySound(wav, winsound.SND_MEMORY | winsound.SND_ASYNC)
 
 
 # --- Tray icon ---
@@ -161,15 +220,20 @@ def make_mic_icon(color, bg=(40, 40, 40)):
     return img
 
 
+# Only two states ever exist — rasterize both once instead of on every toggle.
+_ICON_IDLE = make_mic_icon(color=(120, 220, 120))
+_ICON_REC = make_mic_icon(color=(255, 80, 80))
+
+
 def update_tray(is_recording):
     """Update the tray icon to reflect recording state."""
     if tray_icon is None:
         return
     if is_recording:
-        tray_icon.icon = make_mic_icon(color=(255, 80, 80))
+        tray_icon.icon = _ICON_REC
         tray_icon.title = "Mumble — Recording..."
     else:
-        tray_icon.icon = make_mic_icon(color=(120, 220, 120))
+        tray_icon.icon = _ICON_IDLE
         tray_icon.title = "Mumble — Idle"
 
 
@@ -206,96 +270,305 @@ def setup_tray():
     )
     tray_icon = pystray.Icon(
         "mumble",
-        make_mic_icon(color=(120, 220, 120)),
-        "Mumble — Idle",
+        _ICON_IDLE,
+        "Mumble — Loading model...",
         menu,
     )
     threading.Thread(target=tray_icon.run, daemon=True).start()
 
 
+# --- Whisper ---
+
+def pick_whisper_device():
+    """Pick (device, compute_type) for WhisperModel: CUDA if available, else CPU int8.
+
+    On GPU, prefer int8_float16 (Tensor Cores + int8 weights); ctranslate2 only
+    reports it as supported on compute capability >= 7.0, so older cards fall
+    back to float16. On CPU, prefer int8_float32, which ctranslate2 maps to
+    VNNI int8 dot products where the hardware has them.
+    """
+    try:
+        if ctranslate2.get_cuda_device_count() > 0:
+            supported = ctranslate2.get_supported_compute_types("cuda")
+            for ct in ("int8_float16", "float16"):
+                if ct in supported:
+                    return "cuda", ct
+    except Exception as e:
+        log.warning(f"CUDA probe failed ({e}), using CPU")
+    supported = ctranslate2.get_supported_compute_types("cpu")
+    return "cpu", "int8_float32" if "int8_float32" in supported else "int8"
+
+
+def _build_and_warm(device, compute_type, flash_attention=False):
+    """Construct the WhisperModel and warm it up on a second of silence with
+    the real options, so kernel JIT, CUDA graph capture and the VAD model load
+    all happen at startup, not on the user's first hotkey press."""
+    kwargs = {"device": device, "compute_type": compute_type, "num_workers": 1}
+    if device == "cuda":
+        kwargs["flash_attention"] = flash_attention
+    else:
+        kwargs["cpu_threads"] = _CPU_THREADS
+    m = WhisperModel(MODEL, **kwargs)
+    list(m.transcribe(np.zeros(WHISPER_RATE, dtype=np.float32), **_TRANSCRIBE_OPTS)[0])
+    return m
+
+
+def load_model():
+    """Build the Whisper model and warm it up. Runs on a background thread so
+    hotkeys and the tray are live while the model loads."""
+    global model
+    device, compute_type = pick_whisper_device()
+    if device == "cuda":
+        # Flash attention needs compute capability >= 8.0 while CUDA is worth
+        # using from 7.0; ctranslate2 doesn't expose the capability, so probe
+        # by building with it and fall back without. A broken CUDA stack
+        # (mismatched cuDNN is the classic) falls all the way back to CPU —
+        # slower beats dead.
+        attempts = [
+            ("cuda", compute_type, True),
+            ("cuda", compute_type, False),
+            ("cpu", "int8", False),
+        ]
+    else:
+        attempts = [("cpu", compute_type, False)]
+
+    for device, compute_type, flash in attempts:
+        log.info(f"Loading Whisper model ({MODEL}, {device}, {compute_type}"
+                 f"{', flash attention' if flash else ''})...")
+        try:
+            m = _build_and_warm(device, compute_type, flash)
+            break
+        except Exception:
+            # On a daemon thread an uncaught exception only hits stderr, which
+            # mumble-gui users never see — log it before trying the next rung.
+            log.exception(f"Model load failed ({device}, {compute_type})")
+    else:
+        if tray_icon is not None:
+            tray_icon.title = "Mumble — Model load FAILED (see log)"
+        play_tone(_WAV_ERROR)
+        return
+    model = m
+    update_tray(False)
+    log.info("Model loaded")
+
+
 # --- Audio ---
 
+DEVICE_CACHE_FILE = os.path.join(_log_dir(), "device_cache.json")
+
+
+def _device_fingerprint():
+    """Cheap check that the audio topology hasn't changed since last run."""
+    try:
+        return [int(sd._lib.Pa_GetDeviceCount()), int(sd._lib.Pa_GetDefaultInputDevice())]
+    except Exception:
+        return None
+
+
 def find_c200_device():
-    """Find the Anker C200 mic by name. Returns (index, sample_rate) or (None, None)."""
+    """Find the Anker C200 mic by name. Returns (index, sample_rate) or (None, None).
+
+    query_devices() walks every host API and device (~100-500ms cold start on
+    hosts with many endpoints), so the result is cached and warm restarts skip
+    the scan unless the device topology changed.
+    """
+    fingerprint = _device_fingerprint()
+    if fingerprint is not None:
+        try:
+            with open(DEVICE_CACHE_FILE) as f:
+                cache = json.load(f)
+            if cache["fingerprint"] == fingerprint and cache["device_name"] == DEVICE_NAME_SUBSTRING:
+                log.info(f"Device cache hit: [{cache['device_index']}] (rate: {cache['record_rate']})")
+                return cache["device_index"], cache["record_rate"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    index, rate = None, None
     devices = sd.query_devices()
     for i, d in enumerate(devices):
         if d["max_input_channels"] > 0 and DEVICE_NAME_SUBSTRING in d["name"]:
-            rate = int(d["default_samplerate"])
+            index, rate = i, int(d["default_samplerate"])
             log.info(f"Found C200: [{i}] {d['name']} (rate: {rate} Hz)")
-            return i, rate
-    return None, None
+            break
+
+    if fingerprint is not None:
+        try:
+            with open(DEVICE_CACHE_FILE, "w") as f:
+                json.dump({
+                    "fingerprint": fingerprint,
+                    "device_name": DEVICE_NAME_SUBSTRING,
+                    "device_index": index,
+                    "record_rate": rate,
+                }, f)
+        except OSError:
+            pass
+    return index, rate
+
+
+@dataclass
+class RecorderState:
+    """State of one recording, so the audio callback and the worker threads
+    share one struct instead of a pile of module globals. A fresh instance is
+    created per recording: the stop thread keeps working on the finished
+    instance even if the user immediately starts a new one."""
+    buf: np.ndarray | None = None  # preallocated float32 buffer of 16kHz samples
+    write_idx: int = 0  # samples written into buf so far
+    active: bool = False
+    timer: threading.Timer | None = None
+    resampler: soxr.ResampleStream | None = None  # streaming -> 16kHz, or None
+    partial_texts: list[str] = field(default_factory=list)  # chunk texts streamed while recording
+    consumed_idx: int = 0  # samples already transcribed by the chunk worker
+    worker: threading.Thread | None = None
+
+    def on_audio(self, indata):
+        """Write one audio block, resampled to 16kHz on the fly when needed —
+        no per-block copies, nothing left for the stop path."""
+        block = indata[:, 0]
+        if self.resampler is not None:
+            block = self.resampler.resample_chunk(block)
+        n = min(len(block), len(self.buf) - self.write_idx)
+        self.buf[self.write_idx:self.write_idx + n] = block[:n]
+        self.write_idx += n
+
+
+state = None  # RecorderState of the recording in progress (or the last one)
+input_stream = None  # persistent mic stream, opened once at startup
 
 
 def audio_callback(indata, frames, time_info, status):
-    """Called by sounddevice for each audio block during recording."""
+    """sounddevice callback: forward each block to the recording in progress."""
     if status:
         log.warning(f"Audio status: {status}")
-    if recording:
-        audio_chunks.append(indata.copy())
+    st = state
+    if st is not None and st.active:
+        st.on_audio(indata)
 
 
-def start_recording():
-    """Open the mic stream via sounddevice."""
-    global audio_chunks, input_stream
-    audio_chunks = []
+def open_input_stream():
+    """Open the mic stream once and keep it running for the app's lifetime.
 
+    The callback only writes while a recording is active, so the idle cost is
+    just the (negligible) callback overhead — and every toggle skips
+    PortAudio's open/close driver negotiation (100-400ms on WASAPI).
+    """
+    global input_stream
     kwargs = {
         "samplerate": record_rate,
         "channels": 1,
         "dtype": "float32",
         "callback": audio_callback,
-        "blocksize": 1024,
+        "blocksize": BLOCKSIZE,
     }
     if device_index is not None:
         kwargs["device"] = device_index
 
     input_stream = sd.InputStream(**kwargs)
     input_stream.start()
-    log.info(f"Recording started ({record_rate} Hz)")
+    log.info(f"Mic stream open ({record_rate} Hz)")
 
 
-def stop_recording_and_transcribe():
-    """Stop the mic stream, transcribe collected audio, paste the result."""
-    global input_stream
+def start_recording():
+    """Build fresh state for a new recording; the stream is already running."""
+    st = RecorderState(buf=np.empty(MAX_DURATION * WHISPER_RATE, dtype=np.float32))
+    if record_rate != WHISPER_RATE:
+        st.resampler = soxr.ResampleStream(record_rate, WHISPER_RATE, 1, dtype="float32", quality="QQ")
+    log.info(f"Recording started ({record_rate} Hz)")
+    return st
+
+
+def transcribe_chunks(st):
+    """Transcribe completed chunks while the user is still talking.
+
+    Spreads encoder/decoder work across the recording window so the stop
+    path only pays for the final partial chunk instead of the whole
+    utterance. Exits when the recording flag drops (stop or cancel).
+    """
+    chunk = STREAM_CHUNK_S * WHISPER_RATE
+    while st.active:
+        if st.write_idx - st.consumed_idx >= chunk:
+            piece = st.buf[st.consumed_idx:st.consumed_idx + chunk]
+            st.consumed_idx += chunk
+            segments, _info = model.transcribe(piece, **_TRANSCRIBE_OPTS)
+            text = " ".join(seg.text for seg in segments).strip()
+            if text:
+                st.partial_texts.append(text)
+        else:
+            time.sleep(0.05)
+
+
+# Per-utterance transcribe options, assembled once. (Mel feature extraction
+# itself is already one-time state: WhisperModel builds its FeatureExtractor
+# at construction and reuses it across calls.)
+_TRANSCRIBE_OPTS = dict(
+    language="en",
+    beam_size=BEAM_SIZE,
+    best_of=1,
+    condition_on_previous_text=False,
+    without_timestamps=True,
+    # Skip the hotkey-to-speech gap and the trailing tail — silence still
+    # costs full encoder work and invites repetition hallucinations.
+    vad_filter=VAD_FILTER,
+    vad_parameters=dict(min_silence_duration_ms=300),
+)
+
+# Post-processing patterns, compiled once
+_DIGIT_SPACE = re.compile(r'(?<=\d) (?=\d)')
+_MULTI_SPACE = re.compile(r' {2,}')
 
-    if input_stream:
-        input_stream.stop()
-        input_stream.close()
-        input_stream = None
 
+def stop_recording_and_transcribe(st):
+    """Transcribe the remaining audio, join streamed partials, paste the result."""
     update_tray(False)
 
-    if not audio_chunks:
+    # The stream keeps running after the active flip, so wait out one block
+    # period: a callback that saw active==True may still be inside
+    # resample_chunk / writing buf. (The old per-recording stream.stop() was
+    # this barrier.)
+    time.sleep(BLOCKSIZE / record_rate)
+
+    # Let the chunk worker finish its in-flight piece
+    if st.worker is not None:
+        st.worker.join()
+
+    # Flush the resampler's filter tail (a few ms of audio)
+    if st.resampler is not None:
+        tail = st.resampler.resample_chunk(np.empty(0, dtype=np.float32), last=True)
+        n = min(len(tail), len(st.buf) - st.write_idx)
+        st.buf[st.write_idx:st.write_idx + n] = tail[:n]
+        st.write_idx += n
+
+    if st.write_idx == 0:
         log.info("No audio captured")
         return
 
-    audio_np = np.concatenate(audio_chunks, axis=0).flatten()
-    duration = len(audio_np) / record_rate
-    log.info(f"Audio: {duration:.1f}s ({len(audio_chunks)} chunks)")
-
-    # Resample to 16kHz if needed
-    if record_rate != WHISPER_RATE:
-        g = gcd(record_rate, WHISPER_RATE)
-        audio_np = resample_poly(audio_np, up=WHISPER_RATE // g, down=record_rate // g)
+    duration = st.write_idx / WHISPER_RATE
+    log.info(f"Audio: {duration:.1f}s ({len(st.partial_texts)} chunks streamed)")
 
+    # Only the final partial chunk still needs transcribing
     log.info("Transcribing...")
-    segments, _info = model.transcribe(audio_np, language="en", beam_size=5)
-    text = " ".join(seg.text for seg in segments).strip()
+    texts = list(st.partial_texts)
+    if st.consumed_idx < st.write_idx:
+        segments, _info = model.transcribe(st.buf[st.consumed_idx:st.write_idx], **_TRANSCRIBE_OPTS)
+        tail_text = " ".join(seg.text for seg in segments).strip()
+        if tail_text:
+            texts.append(tail_text)
+    text = " ".join(texts).strip()
 
     if not text:
         log.info("Empty transcription")
         return
 
     # Collapse spaces between individual digits: "1 2 3 4" → "1234"
-    text = re.sub(r'(?<=\d) (?=\d)', '', text)
+    text = _DIGIT_SPACE.sub('', text)
 
     # Collapse runs of multiple spaces into one
-    text = re.sub(r' {2,}', ' ', text)
+    text = _MULTI_SPACE.sub(' ', text)
 
     log.info(f"Transcribed: {text}")
 
     # Voice commands
-    if text.strip("., ").lower() == "show help":
+    command = text.strip("., ").lower()
+    if command == "show help":
         show_help()
         return
 
@@ -304,52 +577,116 @@ def stop_recording_and_transcribe():
     paste_text(text)
 
 
+# --- Paste keystroke via Win32 SendInput ---
+# One syscall for the whole Ctrl+V sequence with deterministic key ordering,
+# instead of four separate press/release round-trips.
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_SCANCODE = 0x0008
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # Only present so the INPUT union has the size SendInput expects.
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    class _U(ctypes.Union):
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _U)]
+
+
+def _key_input(vk, up=False):
+    """Build one scancode INPUT record (scancodes for max app compatibility)."""
+    inp = _INPUT()
+    inp.type = _INPUT_KEYBOARD
+    inp.ki.wScan = _user32.MapVirtualKeyW(vk, 0)  # MAPVK_VK_TO_VSC
+    inp.ki.dwFlags = _KEYEVENTF_SCANCODE | (_KEYEVENTF_KEYUP if up else 0)
+    return inp
+
+
+# Prebuilt Ctrl-down, V-down, V-up, Ctrl-up sequence
+_CTRL_V = (_INPUT * 4)(
+    _key_input(_VK_CONTROL),
+    _key_input(_VK_V),
+    _key_input(_VK_V, up=True),
+    _key_input(_VK_CONTROL, up=True),
+)
+
+
 def paste_text(text):
     """Copy text to clipboard and paste into the active window."""
-    # Wait for modifier keys to be released (e.g. from the hotkey that triggered this)
-    while keyboard.is_pressed('alt') or keyboard.is_pressed('ctrl'):
-        time.sleep(0.05)
-    time.sleep(0.1)
+    # Wait for modifier keys to be released (e.g. from the hotkey that triggered
+    # this) — event-driven rather than polling, so no fixed latency is added.
+    if keyboard.is_pressed('alt') or keyboard.is_pressed('ctrl'):
+        released = threading.Event()
+
+        def _on_release(event):
+            if not (keyboard.is_pressed('alt') or keyboard.is_pressed('ctrl')):
+                released.set()
+
+        hook = keyboard.on_release(_on_release)
+        # Re-check after installing the hook: if the last modifier went up in
+        # the gap, no release event is coming to wake us.
+        if not (keyboard.is_pressed('alt') or keyboard.is_pressed('ctrl')):
+            released.set()
+        released.wait(timeout=1.0)
+        keyboard.unhook(hook)
+    time.sleep(0.02)
     pyperclip.copy(text)
-    kb.press(Key.ctrl)
-    kb.press('v')
-    kb.release('v')
-    kb.release(Key.ctrl)
+    _user32.SendInput(4, _CTRL_V, ctypes.sizeof(_INPUT))
 
 
 def repaste():
     """Re-paste the last transcription."""
     if last_transcription is None:
-        winsound.Beep(300, 200)
+        play_tone(_WAV_ERROR)
         log.info("Repaste: no previous transcription")
         return
     log.info(f"Repasting: {last_transcription}")
     paste_text(last_transcription)
 
 
-def stop_stream():
-    """Stop the mic stream without transcribing."""
-    global input_stream, recording
-    recording = False
-    if input_stream:
-        input_stream.stop()
-        input_stream.close()
-        input_stream = None
-
-
 def cancel_recording():
     """Cancel recording and discard audio."""
-    global audio_chunks, recording_timer
-    if not recording:
+    st = state
+    if st is None or not st.active:
         return
-    if recording_timer is not None:
-        recording_timer.cancel()
-        recording_timer = None
-    stop_stream()
-    audio_chunks = []
+    if st.timer is not None:
+        st.timer.cancel()
+        st.timer = None
+    st.active = False
+    # No join: the worker only touches this discarded instance and exits on
+    # its own once active is False; waiting here could stall the hotkey
+    # dispatch thread for a whole in-flight chunk transcribe.
+    st.worker = None
     update_tray(False)
     log.info("Recording cancelled")
-    winsound.Beep(300, 200)
+    play_tone(_WAV_ERROR)
 
 
 def _timeout_cancel():
@@ -360,25 +697,33 @@ def _timeout_cancel():
 
 def toggle_recording():
     """Toggle recording on/off on hotkey press."""
-    global recording, recording_timer
-
-    if not recording:
-        recording = True
+    global state
+
+    if state is None or not state.active:
+        if model is None:
+            log.info("Hotkey pressed before model finished loading")
+            play_tone(_WAV_ERROR)
+            return
+        st = start_recording()
+        st.active = True
+        st.worker = threading.Thread(target=transcribe_chunks, args=(st,), daemon=True)
+        state = st  # publish before starting the worker — the callback records from here on
+        st.worker.start()
         log.info("Recording...")
-        winsound.Beep(1000, 150)
+        play_tone(_WAV_START)
         update_tray(True)
-        start_recording()
-        recording_timer = threading.Timer(MAX_DURATION, _timeout_cancel)
-        recording_timer.daemon = True
-        recording_timer.start()
+        st.timer = threading.Timer(MAX_DURATION, _timeout_cancel)
+        st.timer.daemon = True
+        st.timer.start()
     else:
-        if recording_timer is not None:
-            recording_timer.cancel()
-            recording_timer = None
-        recording = False
+        st = state
+        if st.timer is not None:
+            st.timer.cancel()
+            st.timer = None
+        st.active = False
         log.info("Stopped, transcribing...")
-        winsound.Beep(500, 150)
-        threading.Thread(target=stop_recording_and_transcribe, daemon=True).start()
+        play_tone(_WAV_STOP)
+        threading.Thread(target=stop_recording_and_transcribe, args=(st,), daemon=True).start()
 
 
 def quit_app():
@@ -431,7 +776,7 @@ def main():
         _remove_startup()
         return
 
-    global model, device_index, record_rate
+    global device_index, record_rate
 
     log.info("=" * 40)
     log.info("Mumble starting")
@@ -443,14 +788,24 @@ def main():
     else:
         log.info("C200 not found — using system default mic")
 
-    # Load Whisper model
-    log.info(f"Loading Whisper model ({MODEL})...")
-    model = WhisperModel(MODEL, device="cpu", compute_type="int8")
-    log.info("Model loaded")
+    # Record at 16kHz directly when the device supports it — skips resampling entirely
+    try:
+        sd.check_input_settings(device=device_index, samplerate=WHISPER_RATE, channels=1)
+        record_rate = WHISPER_RATE
+        log.info(f"Recording natively at {WHISPER_RATE} Hz")
+    except Exception:
+        log.info(f"Device refuses {WHISPER_RATE} Hz — recording at {record_rate} Hz and resampling live")
+
+    # Open the mic stream once — toggling recording is just a flag flip
+    open_input_stream()
 
     # System tray
     setup_tray()
 
+    # Load the Whisper model in the background — the record hotkey beeps
+    # "not ready" until it finishes, everything else works immediately
+    threading.Thread(target=load_model, daemon=True).start()
+
     # Register hotkeys
     keyboard.add_hotkey(HOTKEY, toggle_recording)
     keyboard.add_hotkey(CANCEL_HOTKEY, cancel_recording)
@@ -459,8 +814,7 @@ def main():
     log.info(f"Hotkeys: {HOTKEY} (record), {CANCEL_HOTKEY} (cancel), {REPASTE_HOTKEY} (repaste), {QUIT_HOTKEY} (quit)")
 
     # Startup beep
-    winsound.Beep(800, 100)
-    winsound.Beep(1000, 100)
+    play_tone(_WAV_READY)
     log.info("Ready")
 
     # Keep alive until quit
@@ -471,9 +825,13 @@ def main():
         pass
 
     keyboard.unhook_all()
+    if input_stream:
+        input_stream.stop()
+        input_stream.close()
     if tray_icon:
         tray_icon.stop()
     log.info("Goodbye")
+    _log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -96,7 +96,7 @@ def record_audio(device_id):
     audio_int16 = np.int16(audio * 32767)
     wavfile.write(OUTPUT_FILE, SAMPLE_RATE, audio_int16)
     print(f"  Saved to: {OUTPUT_FILE}\n")
-    return audio.flatten()
+    return audio.reshape(-1)  # view, not a copy — the (N, 1) buffer is contiguous
 
 
 def analyze_audio(audio):